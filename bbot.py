@@ -1,14 +1,27 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
+import asyncio
+import orjson
 import os
 import csv
+import io
+import functools
+from collections import defaultdict, deque
+import heapq
+from itertools import count, islice
 from datetime import datetime, timezone as dt_timezone
 from dotenv import load_dotenv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from pytz import timezone, all_timezones
 
+# pytz.all_timezones is a list, so membership checks are a linear scan.
+_ALL_TZ = frozenset(all_timezones)
+
+@functools.lru_cache(maxsize=512)
+def _tz(name):
+    return timezone(name)
+
 # RUN ------ git pull origin main
 
 # === Load token ===
@@ -17,46 +30,295 @@ BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 
 # === Data Files ===
 AUTHORIZED_USERS_FILE = "authorized_users.json"
-DATA_FILE = "shared_budget.json"
+DATA_FILE = "shared_budget.jsonl" # Append-only transaction log
+LEGACY_DATA_FILE = "shared_budget.json" # Pre-log format, migrated on first start
 REMINDERS_FILE = "reminders.json"
 USER_TIMEZONES_FILE = "user_timezones.json"
 USER_JOBS_FILE = "user_jobs.json" # New file for job data
 
 # === File Initialization ===
+# Bot state files aren't meant to be hand-edited, so they're written compact.
+def _dump_json(data):
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
 def initialize_json_file(file_path, default_data):
-    if not os.path.exists(file_path):
-        with open(file_path, 'w') as f:
-            json.dump(default_data, f, indent=4)
+    # 'x' creates the file only if it's missing, without a separate exists() check.
+    try:
+        with open(file_path, 'xb') as f:
+            f.write(_dump_json(default_data))
+    except FileExistsError:
+        pass
 
 initialize_json_file(AUTHORIZED_USERS_FILE, [922857347494318100, 1121745421971238973])
-initialize_json_file(DATA_FILE, [])
 initialize_json_file(REMINDERS_FILE, [])
 initialize_json_file(USER_TIMEZONES_FILE, {})
 initialize_json_file(USER_JOBS_FILE, {}) # Initialize the new jobs file
 
+# === Write Buffer ===
+# Mutating commands mark a file dirty instead of rewriting it right away.
+# A background task writes each dirty file at most once per interval, so a
+# burst of commands costs a single write per file.
+def _atomic_write(file_path, payload):
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, file_path)
+
+def _append_lines(file_path, payload):
+    with open(file_path, 'ab') as f:
+        f.write(payload)
+
+class DirtyFlusher:
+    def __init__(self, interval=1):
+        self.interval = interval
+        self._dirty = {}
+        self._in_flight = {}
+        self._appends = {}
+        self._task = None
+
+    def mark(self, file_path, data):
+        self._dirty[file_path] = data
+
+    def append(self, file_path, record):
+        # Log records are serialized now: they're a snapshot, not live state.
+        self._appends.setdefault(file_path, bytearray()).extend(_dump_json(record) + b"\n")
+
+    def _take_dirty(self):
+        # Keep anything a previous batch didn't get to; newer marks win.
+        self._in_flight, self._dirty = {**self._in_flight, **self._dirty}, {}
+        appends, self._appends = self._appends, {}
+        # Serialize on the event loop so handlers can't mutate data mid-dump.
+        writes = [(_atomic_write, path, _dump_json(data)) for path, data in self._in_flight.items()]
+        writes += [(_append_lines, path, bytes(payload)) for path, payload in appends.items()]
+        return writes
+
+    def _requeue(self, write, path, payload):
+        if write is _append_lines:
+            self._appends[path] = bytearray(payload) + self._appends.get(path, b"")
+        else:
+            self._dirty.setdefault(path, self._in_flight[path])
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            writes = self._take_dirty()
+            try:
+                while writes:
+                    write, path, payload = writes[0]
+                    try:
+                        await asyncio.to_thread(write, path, payload)
+                    except OSError as e:
+                        print(f"\u274C Failed to write {path}: {e}")
+                        self._requeue(write, path, payload)
+                    writes.pop(0)
+            finally:
+                # If we're cancelled mid-batch (e.g. on shutdown), put back
+                # whatever wasn't written so flush() still picks it up.
+                for write, path, payload in writes:
+                    self._requeue(write, path, payload)
+                self._in_flight = {}
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def flush(self):
+        for write, path, payload in self._take_dirty():
+            write(path, payload)
+        self._in_flight = {}
+
+flusher = DirtyFlusher()
+
 # === Data Loading and Saving Functions ===
-def load_json_data(file_path):
+# Files are only read once, at startup (see AppState); after that, writes go
+# through the write buffer so disk access never stalls the event loop.
+def _read_json(file_path):
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, FileNotFoundError):
         return {} if file_path in [USER_TIMEZONES_FILE, USER_JOBS_FILE] else []
 
-def save_json_data(file_path, data):
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=4)
-
 # Helper functions for specific files
-def load_auth_users(): return load_json_data(AUTHORIZED_USERS_FILE)
-def save_auth_users(users): save_json_data(AUTHORIZED_USERS_FILE, users)
-def load_data(): return load_json_data(DATA_FILE)
-def save_data(data): save_json_data(DATA_FILE, data)
-def load_reminders(): return load_json_data(REMINDERS_FILE)
-def save_reminders(reminders): save_json_data(REMINDERS_FILE, reminders)
-def load_user_timezones(): return load_json_data(USER_TIMEZONES_FILE)
-def save_user_timezones(timezones): save_json_data(USER_TIMEZONES_FILE, timezones)
-def load_user_jobs(): return load_json_data(USER_JOBS_FILE)
-def save_user_jobs(jobs): save_json_data(USER_JOBS_FILE, jobs)
+def save_auth_users(users): flusher.mark(AUTHORIZED_USERS_FILE, sorted(users))
+def save_user_timezones(timezones): flusher.mark(USER_TIMEZONES_FILE, timezones)
+def save_user_jobs(jobs): flusher.mark(USER_JOBS_FILE, jobs)
+
+# === Transaction Store ===
+# Keeps the budget in memory, indexed by ID, with running totals so that
+# edit/delete/summary don't have to scan every transaction.
+#
+# On disk the budget is an append-only JSONL log: /add and /edit append the
+# full transaction, /delete appends a {"_op": "del"} tombstone. The log is
+# replayed on load and compacted at startup once it's mostly stale lines.
+class TransactionStore:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._by_id = {}
+        self._search_blobs = {}
+        self._recent = deque(maxlen=10)
+        self._income_sum = 0.0
+        self._expense_sum = 0.0
+        self.load()
+
+    def _replay_log(self):
+        records = {}
+        line_count = 0
+        torn = False
+        with open(self.file_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A torn final line from a crash mid-append.
+                    torn = True
+                    continue
+                line_count += 1
+                if record.get('_op') == 'del':
+                    records.pop(record['id'], None)
+                else:
+                    records[record['id']] = record
+        return list(records.values()), line_count, torn
+
+    def load(self):
+        if os.path.exists(self.file_path):
+            data, line_count, torn = self._replay_log()
+        else:
+            data, line_count, torn = _read_json(LEGACY_DATA_FILE), None, False
+        # Insertion order doubles as the date index, so sort once here.
+        data = sorted(data, key=lambda t: t['date'])
+        for t in data:
+            # Older records predate date_short; the ISO date prefix is the same value.
+            t.setdefault('date_short', t['date'][:10])
+        self._by_id = {t['id']: t for t in data}
+        self._search_blobs = {t['id']: self._search_blob(t) for t in data}
+        self._refill_recent()
+        self._income_sum = sum(t['amount'] for t in data if t['type'] == 'income')
+        self._expense_sum = sum(t['amount'] for t in data if t['type'] == 'expense')
+        # A torn line must go now, or the next append would be glued onto it.
+        if torn or line_count is None or line_count > 2 * len(data):
+            self.compact()
+
+    def compact(self):
+        _atomic_write(self.file_path, b"".join(_dump_json(t) + b"\n" for t in self._by_id.values()))
+
+    def _apply(self, t, sign):
+        if t['type'] == 'income':
+            self._income_sum += sign * t['amount']
+        elif t['type'] == 'expense':
+            self._expense_sum += sign * t['amount']
+
+    @staticmethod
+    def _search_blob(t):
+        # Lowercased once here so /search is a single substring test per row.
+        return f"{t['description'].lower()}\n{t['category'].lower()}\n{t['amount']}"
+
+    def search(self, keyword):
+        return [self._by_id[i] for i, blob in self._search_blobs.items() if keyword in blob]
+
+    def all(self):
+        return list(self._by_id.values())
+
+    def _refill_recent(self):
+        # Newest first; the index is in date order, so read it from the end.
+        self._recent = deque(islice(reversed(self._by_id.values()), 10), maxlen=10)
+
+    def latest(self):
+        return list(self._recent)
+
+    def add(self, transaction):
+        self._by_id[transaction['id']] = transaction
+        self._search_blobs[transaction['id']] = self._search_blob(transaction)
+        self._recent.appendleft(transaction)
+        self._apply(transaction, 1)
+        flusher.append(self.file_path, transaction)
+
+    def edit(self, trans_id, field, value):
+        t = self._by_id.get(trans_id)
+        if t is None:
+            return False
+        self._apply(t, -1)
+        t[field] = value
+        self._search_blobs[trans_id] = self._search_blob(t)
+        self._apply(t, 1)
+        flusher.append(self.file_path, t)
+        return True
+
+    def delete(self, trans_id):
+        t = self._by_id.pop(trans_id, None)
+        if t is None:
+            return False
+        del self._search_blobs[trans_id]
+        if any(r is t for r in self._recent):
+            self._refill_recent()
+        self._apply(t, -1)
+        if not self._by_id:
+            # Nothing left to sum, so drop any accumulated float error.
+            self._income_sum = self._expense_sum = 0.0
+        flusher.append(self.file_path, {"_op": "del", "id": trans_id})
+        return True
+
+    def totals(self):
+        # Repeated += / -= leaves float noise; round it away to whole cents
+        # (+ 0.0 turns -0.0 into 0.0 so /summary never shows "$-0.00").
+        return round(self._income_sum, 2) + 0.0, round(self._expense_sum, 2) + 0.0
+
+    def __len__(self):
+        return len(self._by_id)
+
+# === Reminder Heap ===
+# Pending reminders in a min-heap keyed by due time (epoch seconds), so a
+# check only touches the reminders that are actually due. Each reminder
+# stores its "epoch" so reloading doesn't have to parse the ISO time.
+class ReminderHeap:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._heap = []
+        # Tie-breaker so equal due times never compare the reminder dicts.
+        self._counter = count()
+        self.load()
+
+    @staticmethod
+    def _epoch(reminder):
+        if "epoch" not in reminder:
+            reminder["epoch"] = datetime.fromisoformat(reminder["time"]).timestamp()
+        return reminder["epoch"]
+
+    def load(self):
+        self._heap = [(self._epoch(r), next(self._counter), r) for r in _read_json(self.file_path)]
+        heapq.heapify(self._heap)
+
+    def save(self):
+        flusher.mark(self.file_path, [r for _, _, r in self._heap])
+
+    def push(self, reminder):
+        heapq.heappush(self._heap, (self._epoch(reminder), next(self._counter), reminder))
+
+    def pop_due(self, now_epoch):
+        due = []
+        while self._heap and self._heap[0][0] <= now_epoch:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def next_epoch(self):
+        return self._heap[0][0] if self._heap else None
+
+    def user_ids(self):
+        return {r["user_id"] for _, _, r in self._heap}
+
+# === App State ===
+# Everything the handlers work with, loaded once at startup and kept in
+# memory. The files on disk are only the durable copy, kept up to date
+# through the write buffer.
+class AppState:
+    def __init__(self):
+        self.auth = set(_read_json(AUTHORIZED_USERS_FILE))
+        self.tx = TransactionStore(DATA_FILE)
+        self.reminders = ReminderHeap(REMINDERS_FILE)
+        self.jobs = _read_json(USER_JOBS_FILE)
+        self.tzs = _read_json(USER_TIMEZONES_FILE)
+
+state = AppState()
 
 
 # === Discord setup ===
@@ -73,36 +335,100 @@ async def on_ready():
         print(f"\u2705 Synced {len(synced)} command(s)")
     except Exception as e:
         print(f"\u274C Failed to sync commands: {e}")
-    scheduler.add_job(check_reminders, 'interval', minutes=1)
-    scheduler.start()
+    flusher.start()
+    schedule_next_reminder()
+    if not scheduler.running:
+        scheduler.start()
+    await warm_user_cache()
+
+# Instead of polling every minute, wake up once when the earliest reminder is due.
+def schedule_next_reminder():
+    next_epoch = state.reminders.next_epoch()
+    if next_epoch is None:
+        return
+    # Overdue reminders (e.g. while the bot was offline) fire right away.
+    now_epoch = datetime.now(dt_timezone.utc).timestamp()
+    run_date = datetime.fromtimestamp(max(next_epoch, now_epoch), dt_timezone.utc)
+    # No misfire grace limit: a late wakeup must still run, or reminders stop
+    # until the next /rm.
+    scheduler.add_job(
+        check_reminders, 'date', run_date=run_date, id='next_reminder',
+        replace_existing=True, misfire_grace_time=None, coalesce=True
+    )
+
+# Users fetched over REST, kept so repeat reminders don't refetch them.
+_user_cache = {}
+
+async def get_user_cached(user_id):
+    user = bot.get_user(user_id) or _user_cache.get(user_id)
+    if user is None:
+        user = await bot.fetch_user(user_id)
+        _user_cache[user_id] = user
+    return user
+
+# Prefetch everyone the bot is likely to DM so reminders don't wait on REST calls.
+async def warm_user_cache():
+    user_ids = [
+        uid for uid in state.auth | state.reminders.user_ids()
+        if bot.get_user(uid) is None and uid not in _user_cache
+    ]
+    users = await asyncio.gather(*(bot.fetch_user(uid) for uid in user_ids), return_exceptions=True)
+    for uid, user in zip(user_ids, users):
+        if isinstance(user, discord.User):
+            _user_cache[uid] = user
+        else:
+            print(f"Could not prefetch user with ID {uid}: {user}")
+
+# Delivery tasks still running; asyncio only keeps weak references to tasks.
+_delivery_tasks = set()
 
 async def check_reminders():
-    now = datetime.now(dt_timezone.utc)
-    reminders = load_reminders()
-    updated_reminders = []
-    for r in reminders:
-        reminder_time = datetime.fromisoformat(r["time"])
-        if now >= reminder_time:
+    due = state.reminders.pop_due(datetime.now(dt_timezone.utc).timestamp())
+    if due:
+        state.reminders.save()
+    schedule_next_reminder()
+    if not due:
+        return
+
+    # Send in a separate task so this job returns right away. A slow delivery
+    # would otherwise still be running when the next reminder is due, and
+    # APScheduler would skip (and, for a 'date' job, drop) that run.
+    task = asyncio.create_task(deliver_reminders(due))
+    _delivery_tasks.add(task)
+    task.add_done_callback(_delivery_tasks.discard)
+
+async def deliver_reminders(due):
+    due_by_user = defaultdict(list)
+    for r in due:
+        due_by_user[r["user_id"]].append(r)
+
+    # Due reminders are already removed from disk, so one failed lookup or DM
+    # (e.g. closed DMs) must not stop delivery to everyone else.
+    for user_id, user_reminders in due_by_user.items():
+        try:
+            user = await get_user_cached(user_id)
+        except discord.NotFound:
+            print(f"User with ID {user_id} not found for reminder.")
+            continue
+        except discord.HTTPException as e:
+            print(f"Could not fetch user with ID {user_id} for reminder: {e}")
+            continue
+        for r in user_reminders:
+            reminder_msg = f"\u23F0 **Reminder from {r['author_name']}:** {r['message']}"
             try:
-                user = await bot.fetch_user(r["user_id"])
-                reminder_msg = f"\u23F0 **Reminder from {r['author_name']}:** {r['message']}"
                 await user.send(reminder_msg)
-            except discord.NotFound:
-                print(f"User with ID {r['user_id']} not found for reminder.")
-        else:
-            updated_reminders.append(r)
-    save_reminders(updated_reminders)
+            except discord.HTTPException as e:
+                print(f"Could not send reminder to user with ID {user_id}: {e}")
 
 @bot.tree.command(name="set_timezone", description="Set your local timezone to be used for reminders.")
 @app_commands.describe(timezone_name="Your timezone (e.g., 'America/Los_Angeles', 'Europe/London').")
 async def set_timezone(interaction: discord.Interaction, timezone_name: str):
-    if timezone_name not in all_timezones:
+    if timezone_name not in _ALL_TZ:
         await interaction.response.send_message("\u274C Invalid timezone. Please use a valid TZ database name.", ephemeral=True)
         return
 
-    user_timezones = load_user_timezones()
-    user_timezones[str(interaction.user.id)] = timezone_name
-    save_user_timezones(user_timezones)
+    state.tzs[str(interaction.user.id)] = timezone_name
+    save_user_timezones(state.tzs)
 
     await interaction.response.send_message(f"\u2705 Your timezone has been set to **{timezone_name}**.", ephemeral=True)
 
@@ -136,7 +462,7 @@ async def set_timezone(interaction: discord.Interaction, timezone_name: str):
 async def remember(
     interaction: discord.Interaction, 
     message: str, 
-    year: app_commands.Range[int, datetime.now().year, 3000],
+    year: app_commands.Range[int, None, 3000],
     month: int,
     day: app_commands.Range[int, 1, 31],
     hour: app_commands.Range[int, 0, 23],
@@ -145,10 +471,15 @@ async def remember(
     user2: discord.User = None, 
     user3: discord.User = None
 ):
+    # The lower bound can't live in the Range annotation: it would be frozen
+    # to whatever year it was when the bot started.
+    if year < datetime.now(dt_timezone.utc).year:
+        await interaction.response.send_message("\u274C You can't set a reminder for a time in the past.", ephemeral=True)
+        return
+
     # Check timezone of the person setting the reminder
-    user_timezones = load_user_timezones()
     author_id_str = str(interaction.user.id)
-    if author_id_str not in user_timezones:
+    if author_id_str not in state.tzs:
         await interaction.response.send_message(
             "\u274C You must set your own timezone with `/set_timezone` before reminding others.", 
             ephemeral=True
@@ -156,9 +487,9 @@ async def remember(
         return
 
     # Parse the time using the author's timezone
-    tz_str = user_timezones[author_id_str]
+    tz_str = state.tzs[author_id_str]
     try:
-        tz = timezone(tz_str)
+        tz = _tz(tz_str)
         # Construct the datetime object from the new, separate inputs
         local_time = datetime(year, month, day, hour, minute)
         aware_time = tz.localize(local_time).astimezone(dt_timezone.utc)
@@ -179,19 +510,20 @@ async def remember(
 
     # Collect all mentioned users
     targets = [u for u in [user1, user2, user3] if u is not None]
-    reminders = load_reminders()
-    
+
     # Create a reminder for each target user
     for target_user in targets:
         reminder = {
             "user_id": target_user.id,
             "author_name": interaction.user.display_name,
             "message": message,
-            "time": aware_time.isoformat()
+            "time": aware_time.isoformat(),
+            "epoch": aware_time.timestamp()
         }
-        reminders.append(reminder)
+        state.reminders.push(reminder)
 
-    save_reminders(reminders)
+    state.reminders.save()
+    schedule_next_reminder()
     
     # Use a Discord timestamp for a clean, auto-localizing confirmation message
     time_unix = int(aware_time.timestamp())
@@ -207,7 +539,7 @@ async def remember(
     wage_per_hour="Your hourly wage (e.g., 15.50)."
 )
 async def setjob(interaction: discord.Interaction, job_name: str, wage_per_hour: float):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized to use this command.", ephemeral=True)
         return
     
@@ -215,12 +547,11 @@ async def setjob(interaction: discord.Interaction, job_name: str, wage_per_hour:
         await interaction.response.send_message("\u274C Wage must be a positive number.", ephemeral=True)
         return
 
-    user_jobs = load_user_jobs()
-    user_jobs[str(interaction.user.id)] = {
+    state.jobs[str(interaction.user.id)] = {
         "job_name": job_name,
         "wage_per_hour": wage_per_hour
     }
-    save_user_jobs(user_jobs)
+    save_user_jobs(state.jobs)
 
     await interaction.response.send_message(f"\u2705 Your job has been set to **{job_name}** with a wage of **${wage_per_hour:.2f}/hour**.")
 
@@ -230,18 +561,17 @@ async def setjob(interaction: discord.Interaction, job_name: str, wage_per_hour:
     hours_worked="The number of hours worked."
 )
 async def estimate(interaction: discord.Interaction, user: discord.User, hours_worked: float):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized to use this command.", ephemeral=True)
         return
 
-    user_jobs = load_user_jobs()
     user_id_str = str(user.id)
 
-    if user_id_str not in user_jobs:
+    if user_id_str not in state.jobs:
         await interaction.response.send_message(f"\u274C **{user.display_name}** has not set a job yet. They can do so with `/setjob`.", ephemeral=True)
         return
         
-    job_info = user_jobs[user_id_str]
+    job_info = state.jobs[user_id_str]
     wage = job_info['wage_per_hour']
     
     gross_pay = wage * hours_worked
@@ -264,30 +594,31 @@ async def estimate(interaction: discord.Interaction, user: discord.User, hours_w
 
 
 # === Budget Bot Commands ===
+_HELP_TEXT = (
+    "**\U0001F4D6 Budget Bot Commands:**\n\n"
+    "`/add type amount category description`\n"
+    "➤ Adds a new income or expense transaction.\n\n"
+    "`/edit id field new_value`\n"
+    "➤ Edits a specific field of an existing transaction.\n\n"
+    "`/search keyword`\n"
+    "➤ Searches for transactions by description, category, or amount.\n\n"
+    "`/list` – Shows the last 10 transactions.\n"
+    "`/summary` – Provides a summary of income, expenses, and net balance.\n"
+    "`/delete id` – Deletes a transaction by its ID.\n"
+    "`/export` – Sends you a DM with the budget data in JSON and CSV formats.\n"
+    "`/authorize @user` – Grants a user permission to use the bot.\n"
+    "`/deauthorize @user` – Revokes a user's permission.\n\n"
+    "**\u23F0 Reminder Commands:**\n"
+    "`/set_timezone timezone_name` – **Set this first!** Saves your local timezone.\n"
+    "`/rm @user(s) message year month day hour minute` – Sets a reminder for other people (or yourself!).\n\n"
+    "**\U0001F4B5 Paycheck Estimator:**\n"
+    "`/setjob job_name wage_per_hour` – Set your job and hourly wage.\n"
+    "`/estimate @user hours_worked` – Estimate a user's paycheck."
+)
+
 @bot.tree.command(name="help", description="Displays a list of all available commands.")
 async def help_command(interaction: discord.Interaction):
-    help_text = (
-        "**\U0001F4D6 Budget Bot Commands:**\n\n"
-        "`/add type amount category description`\n"
-        "➤ Adds a new income or expense transaction.\n\n"
-        "`/edit id field new_value`\n"
-        "➤ Edits a specific field of an existing transaction.\n\n"
-        "`/search keyword`\n"
-        "➤ Searches for transactions by description, category, or amount.\n\n"
-        "`/list` – Shows the last 10 transactions.\n"
-        "`/summary` – Provides a summary of income, expenses, and net balance.\n"
-        "`/delete id` – Deletes a transaction by its ID.\n"
-        "`/export` – Sends you a DM with the budget data in JSON and CSV formats.\n"
-        "`/authorize @user` – Grants a user permission to use the bot.\n"
-        "`/deauthorize @user` – Revokes a user's permission.\n\n"
-        "**\u23F0 Reminder Commands:**\n"
-        "`/set_timezone timezone_name` – **Set this first!** Saves your local timezone.\n"
-        "`/rm @user(s) message year month day hour minute` – Sets a reminder for other people (or yourself!).\n\n"
-        "**\U0001F4B5 Paycheck Estimator:**\n"
-        "`/setjob job_name wage_per_hour` – Set your job and hourly wage.\n"
-        "`/estimate @user hours_worked` – Estimate a user's paycheck."
-    )
-    await interaction.response.send_message(help_text, ephemeral=True)
+    await interaction.response.send_message(_HELP_TEXT, ephemeral=True)
     
 @bot.tree.command(name="add", description="Add a new income or expense transaction.")
 @app_commands.describe(
@@ -301,7 +632,7 @@ async def help_command(interaction: discord.Interaction):
     app_commands.Choice(name="Expense", value="expense"),
 ])
 async def add(interaction: discord.Interaction, trans_type: str, amount: float, category: str, description: str):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized to use this command.", ephemeral=True)
         return
 
@@ -309,11 +640,12 @@ async def add(interaction: discord.Interaction, trans_type: str, amount: float,
         await interaction.response.send_message("\u274C Amount must be a positive number.", ephemeral=True)
         return
 
-    transactions = load_data()
-    transaction_id = int(datetime.now().timestamp() * 1000)
+    now = datetime.now()
+    transaction_id = int(now.timestamp() * 1000)
     transaction = {
         "id": transaction_id,
-        "date": datetime.now().isoformat(),
+        "date": now.isoformat(),
+        "date_short": now.strftime('%Y-%m-%d'),
         "type": trans_type.lower(),
         "amount": amount,
         "category": category.capitalize(),
@@ -321,8 +653,7 @@ async def add(interaction: discord.Interaction, trans_type: str, amount: float,
         "author_id": interaction.user.id,
         "author_name": interaction.user.name
     }
-    transactions.append(transaction)
-    save_data(transactions)
+    state.tx.add(transaction)
     await interaction.response.send_message(f"\u2705 {trans_type.title()} of ${amount:.2f} added for '{description}'.\n\U0001F196 Transaction ID: `{transaction_id}`")
 
 @bot.tree.command(name="edit", description="Edit an existing transaction.")
@@ -338,27 +669,18 @@ async def add(interaction: discord.Interaction, trans_type: str, amount: float,
     app_commands.Choice(name="Type", value="type"),
 ])
 async def edit(interaction: discord.Interaction, trans_id: int, field: str, new_value: str):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized.", ephemeral=True)
         return
 
-    transactions = load_data()
-    found = False
-    for t in transactions:
-        if t['id'] == trans_id:
-            if field == "amount":
-                try:
-                    t[field] = float(new_value)
-                except ValueError:
-                    await interaction.response.send_message("\u274C Invalid amount. Please enter a number.", ephemeral=True)
-                    return
-            else:
-                t[field] = new_value
-            found = True
-            break
-    
-    if found:
-        save_data(transactions)
+    if field == "amount":
+        try:
+            new_value = float(new_value)
+        except ValueError:
+            await interaction.response.send_message("\u274C Invalid amount. Please enter a number.", ephemeral=True)
+            return
+
+    if state.tx.edit(trans_id, field, new_value):
         await interaction.response.send_message(f"\u2705 Transaction `{trans_id}` updated successfully.")
     else:
         await interaction.response.send_message("\u274C Transaction not found.", ephemeral=True)
@@ -366,70 +688,59 @@ async def edit(interaction: discord.Interaction, trans_id: int, field: str, new_
 @bot.tree.command(name="search", description="Search for transactions.")
 @app_commands.describe(keyword="The keyword to search for in description, category, or amount.")
 async def search(interaction: discord.Interaction, keyword: str):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized.", ephemeral=True)
         return
 
     keyword = keyword.lower()
-    transactions = load_data()
-    matches = [
-        t for t in transactions if
-        keyword in t['description'].lower() or
-        keyword in t['category'].lower() or
-        keyword in str(t['amount'])
-    ]
+    matches = state.tx.search(keyword)
     if not matches:
         await interaction.response.send_message("\U0001F50D No matches found.", ephemeral=True)
         return
 
     lines = []
     for t in matches[:10]:
-        date_str = datetime.fromisoformat(t['date']).strftime('%Y-%m-%d')
+        date_str = t['date_short']
         sign = "+" if t['type'] == 'income' else "-"
         lines.append(f"{sign} ${t['amount']:.2f} ({t['category']}) - {t['description']} [{t['id']}] on {date_str}")
 
     await interaction.response.send_message("**\U0001F50D Search Results:**\n" + "\n".join(lines))
 
+def _to_csv_bytes(transactions):
+    sio = io.StringIO(newline='')
+    writer = csv.DictWriter(sio, fieldnames=transactions[0].keys())
+    writer.writeheader()
+    writer.writerows(transactions)
+    return sio.getvalue().encode()
+
 @bot.tree.command(name="export", description="Export all transaction data to a file.")
 async def export(interaction: discord.Interaction):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized.", ephemeral=True)
         return
 
-    transactions = load_data()
+    transactions = state.tx.all()
     if not transactions:
         await interaction.response.send_message("\U0001F4ED No transactions to export.", ephemeral=True)
         return
 
-    json_path = f"budget_export_{interaction.user.id}.json"
-    csv_path = f"budget_export_{interaction.user.id}.csv"
-
-    save_json_data(json_path, transactions)
-
-    with open(csv_path, 'w', newline='') as cf:
-        if transactions:
-            writer = csv.DictWriter(cf, fieldnames=transactions[0].keys())
-            writer.writeheader()
-            writer.writerows(transactions)
+    # Build both files in memory; nothing is written to disk.
+    json_bytes = orjson.dumps(transactions, option=orjson.OPT_INDENT_2)
+    csv_bytes = _to_csv_bytes(transactions)
 
     try:
         await interaction.user.send("\U0001F4C1 Here is your exported budget data:")
-        await interaction.user.send(file=discord.File(json_path))
-        await interaction.user.send(file=discord.File(csv_path))
+        await interaction.user.send(file=discord.File(io.BytesIO(json_bytes), filename=f"budget_export_{interaction.user.id}.json"))
+        await interaction.user.send(file=discord.File(io.BytesIO(csv_bytes), filename=f"budget_export_{interaction.user.id}.csv"))
         await interaction.response.send_message("✅ Exported data has been sent to your DMs.", ephemeral=True)
     except discord.Forbidden:
         await interaction.response.send_message("❌ I couldn't send you a DM. Please check your privacy settings.", ephemeral=True)
-    finally:
-        if os.path.exists(json_path):
-            os.remove(json_path)
-        if os.path.exists(csv_path):
-            os.remove(csv_path)
 
 
 @bot.tree.command(name="authorize", description="Authorize a user to use the bot.")
 @app_commands.describe(user="The user to authorize.")
 async def authorize(interaction: discord.Interaction, user: discord.User):
-    auth_users = load_auth_users()
+    auth_users = state.auth
     if interaction.user.id not in auth_users:
         await interaction.response.send_message("\u274C You are not authorized to manage users.", ephemeral=True)
         return
@@ -437,20 +748,20 @@ async def authorize(interaction: discord.Interaction, user: discord.User):
     if user.id in auth_users:
         await interaction.response.send_message("\u2705 User is already authorized.", ephemeral=True)
     else:
-        auth_users.append(user.id)
+        auth_users.add(user.id)
         save_auth_users(auth_users)
         await interaction.response.send_message(f"\u2705 Authorized {user.mention}.")
 
 @bot.tree.command(name="deauthorize", description="Deauthorize a user from using the bot.")
 @app_commands.describe(user="The user to deauthorize.")
 async def deauthorize(interaction: discord.Interaction, user: discord.User):
-    auth_users = load_auth_users()
+    auth_users = state.auth
     if interaction.user.id not in auth_users:
         await interaction.response.send_message("\u274C You are not authorized to manage users.", ephemeral=True)
         return
 
     if user.id in auth_users:
-        auth_users.remove(user.id)
+        auth_users.discard(user.id)
         save_auth_users(auth_users)
         await interaction.response.send_message(f"\u2705 Deauthorized {user.mention}.")
     else:
@@ -458,19 +769,17 @@ async def deauthorize(interaction: discord.Interaction, user: discord.User):
 
 @bot.tree.command(name="list", description="List the 10 most recent transactions.")
 async def list_transactions(interaction: discord.Interaction):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized.", ephemeral=True)
         return
 
-    transactions = load_data()
-    if not transactions:
+    if not state.tx:
         await interaction.response.send_message("\U0001F914 No transactions recorded yet.", ephemeral=True)
         return
 
-    latest = sorted(transactions, key=lambda t: t['date'], reverse=True)[:10]
     lines = []
-    for t in latest:
-        date_str = datetime.fromisoformat(t['date']).strftime('%Y-%m-%d')
+    for t in state.tx.latest():
+        date_str = t['date_short']
         sign = "+" if t['type'] == 'income' else "-"
         lines.append(f"{sign} ${t['amount']:.2f} ({t['category']}) - {t['description']} [{t['id']}] on {date_str}")
 
@@ -478,13 +787,11 @@ async def list_transactions(interaction: discord.Interaction):
 
 @bot.tree.command(name="summary", description="Show a summary of all income and expenses.")
 async def summary(interaction: discord.Interaction):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized.", ephemeral=True)
         return
 
-    transactions = load_data()
-    income = sum(t['amount'] for t in transactions if t['type'] == 'income')
-    expenses = sum(t['amount'] for t in transactions if t['type'] == 'expense')
+    income, expenses = state.tx.totals()
     balance = income - expenses
 
     msg = (
@@ -498,23 +805,19 @@ async def summary(interaction: discord.Interaction):
 @bot.tree.command(name="delete", description="Delete a transaction by its ID.")
 @app_commands.describe(transaction_id="The unique ID of the transaction to delete.")
 async def delete(interaction: discord.Interaction, transaction_id: int):
-    if interaction.user.id not in load_auth_users():
+    if interaction.user.id not in state.auth:
         await interaction.response.send_message("\u274C You are not authorized.", ephemeral=True)
         return
 
-    transactions = load_data()
-    original_count = len(transactions)
-    new_data = [t for t in transactions if t.get('id') != transaction_id]
-    
-    if len(new_data) == original_count:
-        await interaction.response.send_message("\u274C Transaction not found.", ephemeral=True)
-    else:
-        save_data(new_data)
+    if state.tx.delete(transaction_id):
         await interaction.response.send_message(f"\u2705 Transaction `{transaction_id}` has been deleted.")
+    else:
+        await interaction.response.send_message("\u274C Transaction not found.", ephemeral=True)
 
 # === Run Bot ===
 if __name__ == "__main__":
     if BOT_TOKEN:
         bot.run(BOT_TOKEN)
+        flusher.flush()
     else:
         print("\u274C Discord bot token not found in token.env file.")